@@ -0,0 +1,496 @@
+"""OpenAI content generation helpers: prompt templates, generators and the shared completion call."""
+import os
+import asyncio
+import hashlib
+from urllib.parse import urlparse
+from contextvars import ContextVar
+from typing import Optional, List, Union, AsyncIterator
+from dotenv import load_dotenv
+import openai
+import orjson
+import tiktoken
+from aiocache import Cache
+from aiolimiter import AsyncLimiter
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
+
+# Load environment variables
+load_dotenv()
+
+# OPENAI_MAX_CONCURRENCY and OPENAI_RPM_LIMIT are account-wide; each server
+# worker process (WEB_CONCURRENCY) gets an equal share
+web_workers = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+
+# Limit this worker's concurrent OpenAI calls to its share of the account's limit
+openai_max_concurrency = max(1, int(os.getenv("OPENAI_MAX_CONCURRENCY", "10")) // web_workers)
+openai_semaphore = asyncio.Semaphore(openai_max_concurrency)
+
+# Shared cache for generated content (opt-in per request via `X-Cache: allow`).
+# Disabled unless REDIS_URL is set; short timeouts keep an unreachable Redis
+# from delaying generations.
+response_cache = None
+redis_url = os.getenv("REDIS_URL")
+if redis_url:
+    redis_config = urlparse(redis_url)
+    response_cache = Cache(
+        Cache.REDIS,
+        endpoint=redis_config.hostname or "localhost",
+        port=redis_config.port or 6379,
+        db=int(redis_config.path.lstrip("/") or 0),
+        password=redis_config.password,
+        timeout=0.25,
+        create_connection_timeout=0.25
+    )
+response_cache_ttl = int(os.getenv("RESPONSE_CACHE_TTL", "86400"))
+response_cache_allowed = ContextVar("response_cache_allowed", default=False)
+
+# This worker's share of the account's per-minute request budget
+openai_rate_limiter = AsyncLimiter(max(1, int(os.getenv("OPENAI_RPM_LIMIT", "3500")) // web_workers), 60)
+
+def is_retryable_openai_error(exception: BaseException) -> bool:
+    """Match the errors the OpenAI SDK retries: connection errors, 408, 409, 429 and 5xx."""
+    if isinstance(exception, openai.APIConnectionError):
+        return True
+    if isinstance(exception, openai.APIStatusError):
+        return exception.status_code in (408, 409, 429) or exception.status_code >= 500
+    return False
+
+@retry(
+    retry=retry_if_exception(is_retryable_openai_error),
+    wait=wait_random_exponential(min=1, max=30),
+    stop=stop_after_attempt(6),
+    reraise=True
+)
+async def call_openai_with_retry(client: openai.AsyncOpenAI, **kwargs):
+    """Create a chat completion within the rate limit, backing off on transient errors.
+    
+    Retries are handled here, so client should have max_retries=0.
+    """
+    async with openai_rate_limiter:
+        return await client.chat.completions.create(**kwargs)
+
+# In-flight OpenAI calls keyed by request hash, so identical concurrent
+# generations share a single API call
+inflight_completions = {}
+
+async def create_chat_completion(client: openai.AsyncOpenAI, system_prompt: str, prompt: str, max_tokens: int, temperature: float, model: str = "gpt-3.5-turbo", stream: bool = False) -> Union[str, AsyncIterator[str]]:
+    """Run a chat completion, coalescing identical in-flight requests.
+    
+    With stream=True, returns an async iterator of text chunks instead.
+    """
+    if stream:
+        return stream_chat_completion(client, system_prompt, prompt, max_tokens, temperature, model)
+    
+    key = hashlib.sha256(f"{model}|{system_prompt}|{prompt}|{max_tokens}|{temperature}".encode()).hexdigest()
+    
+    use_cache = response_cache is not None and response_cache_allowed.get()
+    if use_cache:
+        cached_result = await get_cached_completion(key)
+        if cached_result is not None:
+            return cached_result
+    
+    future = inflight_completions.get(key)
+    if future is not None:
+        try:
+            # Shield so a disconnecting follower doesn't cancel the shared call
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                # This follower itself was cancelled
+                raise
+        # The leader was cancelled, not this request: make the call ourselves
+        return await create_chat_completion(client, system_prompt, prompt, max_tokens, temperature, model)
+    
+    future = asyncio.get_running_loop().create_future()
+    inflight_completions[key] = future
+    try:
+        async with openai_semaphore:
+            response = await call_openai_with_retry(
+                client,
+                model=model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=max_tokens,
+                temperature=temperature
+            )
+        result = response.choices[0].message.content
+        future.set_result(result)
+        if use_cache:
+            # Write in the background so the response doesn't wait on Redis
+            task = asyncio.create_task(set_cached_completion(key, result))
+            cache_write_tasks.add(task)
+            task.add_done_callback(cache_write_tasks.discard)
+        return result
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        # Mark as retrieved so asyncio doesn't warn when nobody else was waiting
+        future.exception()
+        raise
+    finally:
+        inflight_completions.pop(key, None)
+
+# Keep references to pending cache writes so they aren't garbage collected
+cache_write_tasks = set()
+
+async def get_cached_completion(key: str) -> Optional[str]:
+    """Look up a cached completion, treating cache errors as a miss."""
+    try:
+        return await response_cache.get(f"completion:{key}")
+    except Exception:
+        return None
+
+async def set_cached_completion(key: str, result: str) -> None:
+    """Store a completion in the response cache, ignoring cache errors."""
+    try:
+        await response_cache.set(f"completion:{key}", result, ttl=response_cache_ttl)
+    except Exception:
+        pass
+
+async def stream_chat_completion(client: openai.AsyncOpenAI, system_prompt: str, prompt: str, max_tokens: int, temperature: float, model: str = "gpt-3.5-turbo") -> AsyncIterator[str]:
+    """Stream a chat completion as text chunks of roughly two words or more."""
+    async with openai_semaphore:
+        response = await call_openai_with_retry(
+            client,
+            model=model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True
+        )
+        
+        # Buffer single-token deltas to avoid flooding the client with tiny frames
+        buffer = ""
+        try:
+            async for chunk in response:
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                buffer += chunk.choices[0].delta.content
+                if buffer.count(" ") >= 2 or "\n" in buffer:
+                    yield buffer
+                    buffer = ""
+            if buffer:
+                yield buffer
+        finally:
+            # Close the upstream response so an abandoned stream stops generating
+            await response.response.aclose()
+
+TRANSCRIPT_SYSTEM_PROMPT = "You are an expert at analyzing and summarizing content."
+TRANSCRIPT_MAX_TOKENS = 1000
+TRANSCRIPT_TEMPERATURE = 0.7
+
+token_encoding = tiktoken.encoding_for_model("gpt-3.5-turbo")
+
+# Prompt token budget: model context minus the response, the system prompt
+# and a margin for chat message formatting. The user prompt's template,
+# title and custom prompt are subtracted per request in build_transcript_prompt.
+MODEL_CONTEXT_TOKENS = 16385  # gpt-3.5-turbo
+CHAT_FORMAT_TOKENS = 32
+TRANSCRIPT_INPUT_TOKENS = (
+    MODEL_CONTEXT_TOKENS
+    - TRANSCRIPT_MAX_TOKENS
+    - len(token_encoding.encode(TRANSCRIPT_SYSTEM_PROMPT))
+    - CHAT_FORMAT_TOKENS
+)
+CUSTOM_PROMPT_MAX_TOKENS = 2000
+
+# Only the first max_tokens * MAX_CHARS_PER_TOKEN characters are encoded, which
+# bounds tokenizer work on huge inputs (typical text is ~4 chars per token)
+MAX_CHARS_PER_TOKEN = 10
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Truncate text to at most max_tokens model tokens."""
+    # Every token covers at least one UTF-8 byte, so short text can't exceed the budget
+    if len(text.encode("utf-8")) <= max_tokens:
+        return text
+    tokens = token_encoding.encode(text[:max_tokens * MAX_CHARS_PER_TOKEN])
+    if len(tokens) <= max_tokens and len(text) <= max_tokens * MAX_CHARS_PER_TOKEN:
+        return text
+    return token_encoding.decode(tokens[:max_tokens])
+
+# Prompt builders by output type, each taking (transcript, title, custom_prompt)
+TRANSCRIPT_PROMPT_BUILDERS = {
+    "summary": lambda transcript, title, _: f"Summarize the main points of this YouTube video titled '{title}'. Transcript:\n\n{transcript}",
+    "notes": lambda transcript, title, _: f"Create detailed notes in bullet point format from this YouTube video titled '{title}'. Transcript:\n\n{transcript}",
+    "explanation": lambda transcript, title, _: f"Explain the content of this YouTube video titled '{title}' in simple terms that are easy to understand. Transcript:\n\n{transcript}",
+    "questions": lambda transcript, title, _: f"Generate important questions and answers based on the content of this YouTube video titled '{title}'. Transcript:\n\n{transcript}",
+    "custom": lambda transcript, title, custom_prompt: f"{custom_prompt}\n\nVideo Title: '{title}'\nTranscript:\n\n{transcript}"
+}
+
+def build_default_transcript_prompt(transcript: str, title: str, custom_prompt: Optional[str] = None) -> str:
+    return f"Analyze the content of this YouTube video titled '{title}'. Transcript:\n\n{transcript}"
+
+def build_transcript_prompt(transcript: str, output_type: str, video_details: dict, custom_prompt: Optional[str] = None) -> str:
+    """Build the user prompt for analyzing a transcript."""
+    if custom_prompt:
+        custom_prompt = truncate_to_tokens(custom_prompt, CUSTOM_PROMPT_MAX_TOKENS)
+    
+    # Create appropriate prompt based on output type
+    title = video_details.get('title', 'YouTube Video')
+    build_prompt = TRANSCRIPT_PROMPT_BUILDERS.get(output_type, build_default_transcript_prompt)
+    if output_type == "custom" and not custom_prompt:
+        # Custom output without a prompt falls back to a general analysis
+        build_prompt = build_default_transcript_prompt
+    
+    # Give the transcript whatever budget the rest of the prompt leaves
+    scaffold_tokens = len(token_encoding.encode(build_prompt("", title, custom_prompt)))
+    transcript = truncate_to_tokens(transcript, TRANSCRIPT_INPUT_TOKENS - scaffold_tokens)
+    return build_prompt(transcript, title, custom_prompt)
+
+async def generate_content_from_transcript(client: openai.AsyncOpenAI, transcript: str, output_type: str, video_details: dict, custom_prompt: Optional[str] = None, stream: bool = False) -> Union[str, AsyncIterator[str]]:
+    """Generate content from transcript using OpenAI API."""
+    # Tokenizing a long transcript is CPU work, so keep it off the event loop
+    prompt = await asyncio.to_thread(build_transcript_prompt, transcript, output_type, video_details, custom_prompt)
+    
+    # Call OpenAI API
+    return await create_chat_completion(
+        client,
+        TRANSCRIPT_SYSTEM_PROMPT,
+        prompt,
+        max_tokens=TRANSCRIPT_MAX_TOKENS,
+        temperature=TRANSCRIPT_TEMPERATURE,
+        stream=stream
+    )
+
+async def submit_transcript_batch(client: openai.AsyncOpenAI, prompts: List[str]) -> dict:
+    """Submit transcript analysis prompts as an OpenAI Batch API job."""
+    lines = []
+    for index, prompt in enumerate(prompts):
+        lines.append(orjson.dumps({
+            "custom_id": f"request-{index}",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": "gpt-3.5-turbo",
+                "messages": [
+                    {"role": "system", "content": TRANSCRIPT_SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                "max_tokens": TRANSCRIPT_MAX_TOKENS,
+                "temperature": TRANSCRIPT_TEMPERATURE
+            }
+        }))
+    
+    batch_file = await client.files.create(
+        file=("batch.jsonl", b"\n".join(lines)),
+        purpose="batch"
+    )
+    batch = await client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    return {"job_id": batch.id, "status": batch.status}
+
+# Batch states after which no more results will be written
+BATCH_FINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+async def get_batch_results(client: openai.AsyncOpenAI, job_id: str) -> dict:
+    """Get the status of a batch job, with its results once it has finished."""
+    batch = await client.batches.retrieve(job_id)
+    job = {"job_id": batch.id, "status": batch.status}
+    if batch.errors and batch.errors.data:
+        # Batch-level failures, e.g. an input file that failed validation
+        job["errors"] = [error.model_dump(exclude_none=True) for error in batch.errors.data]
+    if batch.status not in BATCH_FINAL_STATUSES:
+        return job
+    
+    # Successful requests go to the output file and failed ones to the error file;
+    # expired or cancelled batches may still have partial results in either
+    results = []
+    for file_id in (batch.output_file_id, batch.error_file_id):
+        if file_id:
+            output = await client.files.content(file_id)
+            results.extend(parse_batch_lines(output.text))
+    
+    # Batch output order isn't guaranteed; return results in submission order
+    results.sort(key=lambda r: int(r["custom_id"].rsplit("-", 1)[1]))
+    job["results"] = results
+    return job
+
+def parse_batch_lines(text: str) -> List[dict]:
+    """Parse Batch API output or error JSONL into per-request results."""
+    results = []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        item = orjson.loads(line)
+        response = item.get("response") or {}
+        if item.get("error") or response.get("status_code") != 200:
+            results.append({"custom_id": item["custom_id"], "error": item.get("error") or response.get("body")})
+        else:
+            results.append({"custom_id": item["custom_id"], "result": response["body"]["choices"][0]["message"]["content"]})
+    return results
+
+# Platform and writing style guides for social media prompts
+PLATFORM_GUIDES = {
+    "linkedin": "professional post for LinkedIn that includes bullet points, some emojis, and relevant hashtags",
+    "twitter": "concise tweet for X (Twitter) within 280 characters, with relevant hashtags",
+    "youtube": "engaging community post for YouTube that encourages interaction",
+    "instagram": "visually descriptive caption for Instagram with appropriate emojis and hashtags"
+}
+
+STYLE_GUIDES = {
+    "professional": "in a formal, business-oriented tone",
+    "casual": "in a friendly, conversational approach",
+    "inspirational": "in a motivational and uplifting style",
+    "educational": "in an informative and teaching-focused manner",
+    "humorous": "with light-hearted appropriate humor",
+    "thought-provoking": "that encourages discussion and reflection"
+}
+
+SOCIAL_SYSTEM_PROMPT = "You are an expert at creating engaging social media content."
+
+async def generate_social_media_post(client: openai.AsyncOpenAI, topic: str, platform: str, writing_style: str, custom_instructions: Optional[str] = None, stream: bool = False) -> Union[str, AsyncIterator[str]]:
+    """Generate a social media post using OpenAI API."""
+    platform_guide = PLATFORM_GUIDES.get(platform, PLATFORM_GUIDES["linkedin"])
+    style_guide = STYLE_GUIDES.get(writing_style, STYLE_GUIDES["professional"])
+    
+    prompt = f"Create a {platform_guide} {style_guide} about the topic: {topic}."
+    
+    if custom_instructions:
+        prompt += f"\n\nAdditional instructions: {custom_instructions}"
+    
+    # Call OpenAI API
+    return await create_chat_completion(
+        client,
+        SOCIAL_SYSTEM_PROMPT,
+        prompt,
+        max_tokens=800,
+        temperature=0.8,
+        stream=stream
+    )
+
+COMMENT_SYSTEM_PROMPT = "You are an expert at creating engaging and authentic comments."
+
+async def generate_comment_for_content(client: openai.AsyncOpenAI, content: str, platform: str, tone: str, custom_instructions: Optional[str] = None, stream: bool = False) -> Union[str, AsyncIterator[str]]:
+    """Generate a comment for the given content using OpenAI API."""
+    # Create prompt based on platform and tone
+    prompt = f"Generate a thoughtful {tone} comment for the following {platform} content:\n\n{content}"
+    
+    if custom_instructions:
+        prompt += f"\n\nAdditional instructions: {custom_instructions}"
+    
+    # Call OpenAI API
+    return await create_chat_completion(
+        client,
+        COMMENT_SYSTEM_PROMPT,
+        prompt,
+        max_tokens=300,
+        temperature=0.7,
+        stream=stream
+    )
+
+# Ticket type specific prompts
+TICKET_PROMPTS = {
+    "epic": "Create a comprehensive Epic description that includes business value, scope, and acceptance criteria",
+    "story": "Create a detailed User Story following the format: 'As a [user], I want [goal] so that [benefit]', include acceptance criteria and definition of done",
+    "task": "Create a clear Task description with specific steps, requirements, and deliverables",
+    "bug": "Create a detailed Bug report with steps to reproduce, expected vs actual behavior, and environment details",
+    "improvement": "Create an Improvement description explaining the current state, proposed enhancement, and expected benefits",
+    "feature": "Create a Feature description with user requirements, functional specifications, and acceptance criteria"
+}
+
+JIRA_SYSTEM_PROMPT = "You are an expert at creating professional Jira tickets and project management documentation."
+
+async def generate_jira_ticket_content(client: openai.AsyncOpenAI, subject: str, rough_description: str, ticket_type: str, priority: str, stream: bool = False) -> Union[str, AsyncIterator[str]]:
+    """Generate professional Jira ticket content using OpenAI API."""
+    
+    ticket_prompt = TICKET_PROMPTS.get(ticket_type, TICKET_PROMPTS["task"])
+    
+    prompt = f"""
+    {ticket_prompt} for a Jira ticket.
+    
+    Subject: {subject}
+    Priority: {priority}
+    Rough Description: {rough_description}
+    
+    Format the response professionally with clear sections and use markdown formatting where appropriate.
+    Include relevant sections like:
+    - Description/Summary
+    - Acceptance Criteria (where applicable)
+    - Steps to Reproduce (for bugs)
+    - Requirements
+    - Notes/Additional Information
+    
+    Make it comprehensive but concise, suitable for a development team.
+    """
+    
+    # Call OpenAI API
+    return await create_chat_completion(
+        client,
+        JIRA_SYSTEM_PROMPT,
+        prompt,
+        max_tokens=1200,
+        temperature=0.7,
+        stream=stream
+    )
+
+# Content type specific prompts
+CONTENT_PROMPTS = {
+    "meeting-agenda": "Create a professional meeting agenda",
+    "meeting-description": "Create a comprehensive meeting description",
+    "slack-message": "Create an engaging Slack message"
+}
+
+# Tone specific guidelines
+TONE_GUIDELINES = {
+    "professional": "using formal business language and structure",
+    "casual": "using friendly, relaxed language",
+    "friendly": "using warm, approachable language",
+    "urgent": "using direct, action-oriented language that conveys importance",
+    "informative": "using clear, educational language that explains well",
+    "collaborative": "using inclusive language that encourages participation"
+}
+
+# Style specific formatting
+STYLE_GUIDELINES = {
+    "concise": "Keep it brief and to the point",
+    "detailed": "Provide comprehensive information with thorough explanations",
+    "bullet-points": "Use bullet points and structured formatting",
+    "structured": "Use clear sections and organized formatting",
+    "action-oriented": "Focus on actionable items and next steps"
+}
+
+COMMUNICATION_SYSTEM_PROMPT = "You are an expert at creating professional business communication content."
+
+async def generate_communication_content(client: openai.AsyncOpenAI, content_type: str, subject: str, details: Optional[str], tone: str, style: str, additional_info: Optional[str] = None, stream: bool = False) -> Union[str, AsyncIterator[str]]:
+    """Generate communication content using OpenAI API."""
+    
+    base_prompt = CONTENT_PROMPTS.get(content_type, "Create professional communication content")
+    tone_guide = TONE_GUIDELINES.get(tone, "using appropriate professional language")
+    style_guide = STYLE_GUIDELINES.get(style, "with clear formatting")
+    
+    # Build the main prompt
+    prompt = f"{base_prompt} {tone_guide} and {style_guide}.\n\n"
+    prompt += f"Subject/Title: {subject}\n"
+    
+    if details:
+        prompt += f"Context/Details: {details}\n"
+    
+    # Add specific instructions based on content type
+    if content_type == "meeting-agenda":
+        prompt += "\nInclude: Meeting objectives, agenda items with time allocations, attendees/roles, and action items. Format it professionally."
+    elif content_type == "meeting-description":
+        prompt += "\nInclude: Meeting purpose, expected outcomes, key discussion points, and participant expectations."
+    elif content_type == "slack-message":
+        prompt += "\nMake it appropriate for team communication, engaging, and clear. Include relevant emojis if the tone allows."
+    
+    if additional_info:
+        prompt += f"\nAdditional Requirements: {additional_info}"
+    
+    # Call OpenAI API
+    return await create_chat_completion(
+        client,
+        COMMUNICATION_SYSTEM_PROMPT,
+        prompt,
+        max_tokens=1000,
+        temperature=0.7,
+        stream=stream
+    )
@@ -1,24 +1,93 @@
 import os
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Depends, Header, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, AsyncIterator
 from dotenv import load_dotenv
+from contextlib import asynccontextmanager
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import httpx
 import openai
 from youtube_transcript_api import YouTubeTranscriptApi
-from pytube import YouTube
+import yt_dlp
 import re
-import requests
-import base64
-import json
+import orjson
+import threading
+import functools
+from datetime import datetime
+from cachetools import TTLCache, cached
+from helpers.openai_gen import (
+    TRANSCRIPT_INPUT_TOKENS,
+    build_transcript_prompt,
+    generate_comment_for_content,
+    generate_communication_content,
+    generate_content_from_transcript,
+    generate_jira_ticket_content,
+    generate_social_media_post,
+    get_batch_results,
+    openai_max_concurrency,
+    response_cache,
+    response_cache_allowed,
+    submit_transcript_batch,
+    token_encoding,
+)
 
 # Load environment variables
 load_dotenv()
 
-# Setup OpenAI API key
-openai.api_key = os.getenv("OPENAI_API_KEY")
+# Thread pool for blocking YouTube I/O (yt-dlp / transcript API)
+io_executor = ThreadPoolExecutor(max_workers=int(os.getenv("IO_MAX_WORKERS", "32")))
+
+async def read_cache_header(x_cache: Optional[str] = Header(None)):
+    """Allow cached generations for requests sent with `X-Cache: allow`."""
+    response_cache_allowed.set(x_cache == "allow")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Shared OpenAI client. HTTP/2 multiplexes concurrent completions over a
+    # few connections, and at least one keep-alive connection is kept per
+    # allowed concurrent call so bursts skip fresh TCP/TLS handshakes.
+    app.state.openai = openai.AsyncOpenAI(
+        api_key=os.getenv("OPENAI_API_KEY"),
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=200,
+                max_keepalive_connections=max(50, openai_max_concurrency)
+            ),
+            http2=True
+        )
+    )
+    # Chat completions retry via call_openai_with_retry, so derive (once) a
+    # client sharing the same connection pool with the SDK's retries disabled
+    app.state.openai_chat = app.state.openai.with_options(max_retries=0)
+    # Shared Jira HTTP client (keep-alive connections across ticket creations)
+    app.state.jira_client = httpx.AsyncClient(
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    )
+    yield
+    await app.state.openai.close()
+    await app.state.jira_client.aclose()
+    if response_cache is not None:
+        await response_cache.close()
 
-app = FastAPI(title="AI Toolbox API")
+def get_openai(request: Request) -> openai.AsyncOpenAI:
+    return request.app.state.openai
+
+def get_openai_chat(request: Request) -> openai.AsyncOpenAI:
+    return request.app.state.openai_chat
+
+def get_jira_client(request: Request) -> httpx.AsyncClient:
+    return request.app.state.jira_client
+
+app = FastAPI(
+    title="AI Toolbox API",
+    lifespan=lifespan,
+    dependencies=[Depends(read_cache_header)],
+    default_response_class=ORJSONResponse
+)
 
 # Add CORS middleware
 app.add_middleware(
@@ -86,27 +155,33 @@ def read_root():
     return {"message": "Welcome to AI Toolbox API"}
 
 @app.post("/api/youtube/summarize")
-async def summarize_youtube(request: YouTubeRequest):
+async def summarize_youtube(request: YouTubeRequest, stream: bool = False, openai_client: openai.AsyncOpenAI = Depends(get_openai_chat)):
     try:
         # Extract video ID from URL
         video_id = extract_youtube_id(request.video_url)
         if not video_id:
             raise HTTPException(status_code=400, detail="Invalid YouTube URL")
         
-        # Get video details
-        video_details = get_video_details(video_id)
-        
-        # Get transcript
-        transcript = get_youtube_transcript(video_id, request.language)
+        # Get video details and transcript in parallel, off the event loop
+        loop = asyncio.get_running_loop()
+        video_details, transcript = await asyncio.gather(
+            loop.run_in_executor(io_executor, get_video_details, video_id),
+            loop.run_in_executor(io_executor, get_youtube_transcript, video_id, request.language)
+        )
         
         # Generate content based on output type
-        result = generate_content_from_transcript(
+        result = await generate_content_from_transcript(
+            openai_client,
             transcript, 
             request.output_type, 
             video_details, 
-            request.custom_prompt
+            request.custom_prompt,
+            stream=stream
         )
         
+        if stream:
+            return sse_response(result, video_details=video_details)
+        
         return {
             "result": result,
             "video_details": video_details
@@ -115,33 +190,75 @@ async def summarize_youtube(request: YouTubeRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/transcript/analyze")
-async def analyze_transcript(request: TranscriptRequest):
+async def analyze_transcript(request: TranscriptRequest, stream: bool = False, openai_client: openai.AsyncOpenAI = Depends(get_openai_chat)):
     try:
         # Generate content from provided transcript
-        result = generate_content_from_transcript(
+        result = await generate_content_from_transcript(
+            openai_client,
             request.transcript, 
             request.output_type,
             {"title": "Custom Transcript"}, 
-            request.custom_prompt
+            request.custom_prompt,
+            stream=stream
         )
         
+        if stream:
+            return sse_response(result)
+        
         return {
             "result": result
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/transcript/analyze_batch")
+async def analyze_transcript_batch(requests: List[TranscriptRequest], openai_client: openai.AsyncOpenAI = Depends(get_openai)):
+    if not requests:
+        raise HTTPException(status_code=400, detail="At least one transcript request is required")
+    
+    try:
+        # Submit as a non-interactive batch job (results within 24h at lower cost)
+        # Tokenizing long transcripts is CPU work, so keep it off the event loop
+        loop = asyncio.get_running_loop()
+        prompts = await asyncio.gather(*[
+            loop.run_in_executor(
+                io_executor,
+                build_transcript_prompt,
+                request.transcript,
+                request.output_type,
+                {"title": "Custom Transcript"},
+                request.custom_prompt
+            )
+            for request in requests
+        ])
+        return await submit_transcript_batch(openai_client, prompts)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str, openai_client: openai.AsyncOpenAI = Depends(get_openai)):
+    try:
+        # Poll this endpoint until status is completed, failed, expired or cancelled
+        return await get_batch_results(openai_client, job_id)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/api/social/generate")
-async def generate_social(request: SocialMediaRequest):
+async def generate_social(request: SocialMediaRequest, stream: bool = False, openai_client: openai.AsyncOpenAI = Depends(get_openai_chat)):
     try:
         # Generate social media post
-        result = generate_social_media_post(
+        result = await generate_social_media_post(
+            openai_client,
             request.topic,
             request.platform,
             request.writing_style,
-            request.custom_instructions
+            request.custom_instructions,
+            stream=stream
         )
         
+        if stream:
+            return sse_response(result)
+        
         return {
             "result": result
         }
@@ -149,16 +266,21 @@ async def generate_social(request: SocialMediaRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/comments/generate")
-async def generate_comment(request: CommentRequest):
+async def generate_comment(request: CommentRequest, stream: bool = False, openai_client: openai.AsyncOpenAI = Depends(get_openai_chat)):
     try:
         # Generate comment
-        result = generate_comment_for_content(
+        result = await generate_comment_for_content(
+            openai_client,
             request.content,
             request.platform,
             request.tone,
-            request.custom_instructions
+            request.custom_instructions,
+            stream=stream
         )
         
+        if stream:
+            return sse_response(result)
+        
         return {
             "result": result
         }
@@ -166,16 +288,21 @@ async def generate_comment(request: CommentRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/jira/generate")
-async def generate_jira_content(request: JiraGenerateRequest):
+async def generate_jira_content(request: JiraGenerateRequest, stream: bool = False, openai_client: openai.AsyncOpenAI = Depends(get_openai_chat)):
     try:
         # Generate Jira ticket content
-        result = generate_jira_ticket_content(
+        result = await generate_jira_ticket_content(
+            openai_client,
             request.subject,
             request.rough_description,
             request.ticket_type,
-            request.priority
+            request.priority,
+            stream=stream
         )
         
+        if stream:
+            return sse_response(result)
+        
         return {
             "result": result
         }
@@ -183,10 +310,11 @@ async def generate_jira_content(request: JiraGenerateRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/jira/create")
-async def create_jira_ticket(request: JiraCreateRequest):
+async def create_jira_ticket(request: JiraCreateRequest, jira_client: httpx.AsyncClient = Depends(get_jira_client)):
     try:
         # Create Jira ticket
-        ticket_url = create_jira_ticket_in_instance(
+        ticket_url = await create_jira_ticket_in_instance(
+            jira_client,
             request.subject,
             request.content,
             request.ticket_type,
@@ -202,18 +330,23 @@ async def create_jira_ticket(request: JiraCreateRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/communication/generate")
-async def generate_communication(request: CommunicationRequest):
+async def generate_communication(request: CommunicationRequest, stream: bool = False, openai_client: openai.AsyncOpenAI = Depends(get_openai_chat)):
     try:
         # Generate communication content
-        result = generate_communication_content(
+        result = await generate_communication_content(
+            openai_client,
             request.content_type,
             request.subject,
             request.details,
             request.tone,
             request.style,
-            request.additional_info
+            request.additional_info,
+            stream=stream
         )
         
+        if stream:
+            return sse_response(result)
+        
         return {
             "result": result
         }
@@ -222,21 +355,35 @@ async def generate_communication(request: CommunicationRequest):
 
 # ... keep existing code (helper functions for YouTube, social media, etc.)
 
+def sse_response(chunks: AsyncIterator[str], **initial_data) -> StreamingResponse:
+    """Wrap streamed text chunks in a Server-Sent Events response."""
+    async def event_generator():
+        if initial_data:
+            yield b"data: " + orjson.dumps(initial_data) + b"\n\n"
+        try:
+            async for delta in chunks:
+                yield b"data: " + orjson.dumps({"delta": delta}) + b"\n\n"
+        except Exception as e:
+            yield b"event: error\ndata: " + orjson.dumps({"detail": str(e)}) + b"\n\n"
+            return
+        yield b"event: done\ndata: {}\n\n"
+    
+    return StreamingResponse(event_generator(), media_type="text/event-stream")
+
+# Handles watch?v=, youtu.be/, embed/ and v/ URL formats
+YOUTUBE_ID_PATTERN = re.compile(r'(?:youtube\.com/(?:watch\?v=|embed/|v/)|youtu\.be/)([^&?/]+)')
+
 def extract_youtube_id(url: str) -> str:
     """Extract the YouTube video ID from a URL."""
-    # Handle different YouTube URL formats
-    patterns = [
-        r'(?:youtube\.com/watch\?v=|youtu\.be/)([^&\?]+)',
-        r'youtube\.com/embed/([^/\?]+)',
-        r'youtube\.com/v/([^/\?]+)'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    return None
+    match = YOUTUBE_ID_PATTERN.search(url)
+    return match.group(1) if match else None
 
+# Cache YouTube lookups so repeat requests for the same video skip the network
+youtube_cache_ttl = int(os.getenv("YOUTUBE_CACHE_TTL", "3600"))
+transcript_cache = TTLCache(maxsize=1024, ttl=youtube_cache_ttl)
+video_details_cache = TTLCache(maxsize=1024, ttl=youtube_cache_ttl)
+
+@cached(transcript_cache, lock=threading.Lock())
 def get_youtube_transcript(video_id: str, language: str = "english") -> str:
     """Get the transcript of a YouTube video."""
     try:
@@ -245,264 +392,84 @@ def get_youtube_transcript(video_id: str, language: str = "english") -> str:
             languages=[language] if language != "english" else ['en']
         )
         
-        # Combine all transcript parts
-        full_transcript = " ".join([part["text"] for part in transcript_list])
-        return full_transcript
+        # Combine transcript parts, stopping once past the model's input budget
+        # (generation truncates to the exact token count anyway)
+        parts = []
+        token_count = 0
+        for part in transcript_list:
+            parts.append(part["text"])
+            token_count += len(token_encoding.encode(part["text"])) + 1
+            if token_count > TRANSCRIPT_INPUT_TOKENS:
+                break
+        return " ".join(parts)
     except Exception as e:
         raise Exception(f"Failed to get transcript: {str(e)}")
 
+# yt-dlp instances aren't thread-safe, so keep one per executor thread
+ytdl_local = threading.local()
+
+def get_ytdl() -> yt_dlp.YoutubeDL:
+    """Get this thread's reusable metadata-only YoutubeDL instance."""
+    if not hasattr(ytdl_local, "ytdl"):
+        ytdl_local.ytdl = yt_dlp.YoutubeDL({
+            "quiet": True,
+            "no_warnings": True,
+            "skip_download": True,
+            # Only metadata is needed, so don't fail when formats can't be resolved
+            "ignore_no_formats_error": True
+        })
+    return ytdl_local.ytdl
+
+@cached(video_details_cache, lock=threading.Lock())
+def fetch_video_details(video_id: str) -> dict:
+    """Fetch video details using yt-dlp."""
+    info = get_ytdl().extract_info(f"https://www.youtube.com/watch?v={video_id}", download=False)
+    upload_date = info.get("upload_date")
+    return {
+        "title": info.get("title"),
+        "author": info.get("uploader"),
+        "length": info.get("duration"),
+        "views": info.get("view_count"),
+        "publish_date": str(datetime.strptime(upload_date, "%Y%m%d") if upload_date else None),
+        "thumbnail_url": info.get("thumbnail")
+    }
+
 def get_video_details(video_id: str) -> dict:
-    """Get video details using pytube."""
+    """Get video details, falling back to minimal details on failure."""
     try:
-        yt = YouTube(f"https://www.youtube.com/watch?v={video_id}")
-        return {
-            "title": yt.title,
-            "author": yt.author,
-            "length": yt.length,
-            "views": yt.views,
-            "publish_date": str(yt.publish_date),
-            "thumbnail_url": yt.thumbnail_url
-        }
+        return fetch_video_details(video_id)
     except Exception as e:
-        # Return minimal details if unable to fetch
+        # Return minimal details if unable to fetch (not cached, so it is retried)
         return {
             "title": "YouTube Video",
             "author": "Unknown"
         }
 
-def generate_content_from_transcript(transcript: str, output_type: str, video_details: dict, custom_prompt: Optional[str] = None) -> str:
-    """Generate content from transcript using OpenAI API."""
-    # Truncate transcript if too long (OpenAI has token limits)
-    max_tokens = 4000  # Adjust based on your model
-    transcript = transcript[:max_tokens]
-    
-    # Create appropriate prompt based on output type
-    if output_type == "summary":
-        prompt = f"Summarize the main points of this YouTube video titled '{video_details.get('title', 'YouTube Video')}'. Transcript:\n\n{transcript}"
-    elif output_type == "notes":
-        prompt = f"Create detailed notes in bullet point format from this YouTube video titled '{video_details.get('title', 'YouTube Video')}'. Transcript:\n\n{transcript}"
-    elif output_type == "explanation":
-        prompt = f"Explain the content of this YouTube video titled '{video_details.get('title', 'YouTube Video')}' in simple terms that are easy to understand. Transcript:\n\n{transcript}"
-    elif output_type == "questions":
-        prompt = f"Generate important questions and answers based on the content of this YouTube video titled '{video_details.get('title', 'YouTube Video')}'. Transcript:\n\n{transcript}"
-    elif output_type == "custom" and custom_prompt:
-        prompt = f"{custom_prompt}\n\nVideo Title: '{video_details.get('title', 'YouTube Video')}'\nTranscript:\n\n{transcript}"
-    else:
-        prompt = f"Analyze the content of this YouTube video titled '{video_details.get('title', 'YouTube Video')}'. Transcript:\n\n{transcript}"
-    
-    # Call OpenAI API
-    response = openai.chat.completions.create(
-        model="gpt-3.5-turbo",
-        messages=[
-            {"role": "system", "content": "You are an expert at analyzing and summarizing content."},
-            {"role": "user", "content": prompt}
-        ],
-        max_tokens=1000,
-        temperature=0.7
-    )
-    
-    # Return the generated content
-    return response.choices[0].message.content
-
-def generate_social_media_post(topic: str, platform: str, writing_style: str, custom_instructions: Optional[str] = None) -> str:
-    """Generate a social media post using OpenAI API."""
-    # Create prompt based on platform and style
-    platform_guides = {
-        "linkedin": "professional post for LinkedIn that includes bullet points, some emojis, and relevant hashtags",
-        "twitter": "concise tweet for X (Twitter) within 280 characters, with relevant hashtags",
-        "youtube": "engaging community post for YouTube that encourages interaction",
-        "instagram": "visually descriptive caption for Instagram with appropriate emojis and hashtags"
-    }
-    
-    style_guides = {
-        "professional": "in a formal, business-oriented tone",
-        "casual": "in a friendly, conversational approach",
-        "inspirational": "in a motivational and uplifting style",
-        "educational": "in an informative and teaching-focused manner",
-        "humorous": "with light-hearted appropriate humor",
-        "thought-provoking": "that encourages discussion and reflection"
-    }
-    
-    platform_guide = platform_guides.get(platform, platform_guides["linkedin"])
-    style_guide = style_guides.get(writing_style, style_guides["professional"])
-    
-    prompt = f"Create a {platform_guide} {style_guide} about the topic: {topic}."
-    
-    if custom_instructions:
-        prompt += f"\n\nAdditional instructions: {custom_instructions}"
-    
-    # Call OpenAI API
-    response = openai.chat.completions.create(
-        model="gpt-3.5-turbo",
-        messages=[
-            {"role": "system", "content": "You are an expert at creating engaging social media content."},
-            {"role": "user", "content": prompt}
-        ],
-        max_tokens=800,
-        temperature=0.8
-    )
-    
-    # Return the generated post
-    return response.choices[0].message.content
+# Map ticket types to Jira issue types
+JIRA_ISSUE_TYPES = {
+    "epic": "Epic",
+    "story": "Story",
+    "task": "Task",
+    "bug": "Bug",
+    "improvement": "Improvement",
+    "feature": "New Feature"
+}
 
-def generate_comment_for_content(content: str, platform: str, tone: str, custom_instructions: Optional[str] = None) -> str:
-    """Generate a comment for the given content using OpenAI API."""
-    # Create prompt based on platform and tone
-    prompt = f"Generate a thoughtful {tone} comment for the following {platform} content:\n\n{content}"
-    
-    if custom_instructions:
-        prompt += f"\n\nAdditional instructions: {custom_instructions}"
-    
-    # Call OpenAI API
-    response = openai.chat.completions.create(
-        model="gpt-3.5-turbo",
-        messages=[
-            {"role": "system", "content": "You are an expert at creating engaging and authentic comments."},
-            {"role": "user", "content": prompt}
-        ],
-        max_tokens=300,
-        temperature=0.7
-    )
-    
-    # Return the generated comment
-    return response.choices[0].message.content
-
-def generate_jira_ticket_content(subject: str, rough_description: str, ticket_type: str, priority: str) -> str:
-    """Generate professional Jira ticket content using OpenAI API."""
-    
-    # Create ticket type specific prompts
-    ticket_prompts = {
-        "epic": "Create a comprehensive Epic description that includes business value, scope, and acceptance criteria",
-        "story": "Create a detailed User Story following the format: 'As a [user], I want [goal] so that [benefit]', include acceptance criteria and definition of done",
-        "task": "Create a clear Task description with specific steps, requirements, and deliverables",
-        "bug": "Create a detailed Bug report with steps to reproduce, expected vs actual behavior, and environment details",
-        "improvement": "Create an Improvement description explaining the current state, proposed enhancement, and expected benefits",
-        "feature": "Create a Feature description with user requirements, functional specifications, and acceptance criteria"
-    }
-    
-    ticket_prompt = ticket_prompts.get(ticket_type, ticket_prompts["task"])
-    
-    prompt = f"""
-    {ticket_prompt} for a Jira ticket.
-    
-    Subject: {subject}
-    Priority: {priority}
-    Rough Description: {rough_description}
-    
-    Format the response professionally with clear sections and use markdown formatting where appropriate.
-    Include relevant sections like:
-    - Description/Summary
-    - Acceptance Criteria (where applicable)
-    - Steps to Reproduce (for bugs)
-    - Requirements
-    - Notes/Additional Information
-    
-    Make it comprehensive but concise, suitable for a development team.
-    """
-    
-    # Call OpenAI API
-    response = openai.chat.completions.create(
-        model="gpt-3.5-turbo",
-        messages=[
-            {"role": "system", "content": "You are an expert at creating professional Jira tickets and project management documentation."},
-            {"role": "user", "content": prompt}
-        ],
-        max_tokens=1200,
-        temperature=0.7
-    )
-    
-    return response.choices[0].message.content
+# Content-Type is set by httpx when sending json=
+JIRA_HEADERS = {'Accept': 'application/json'}
 
-def generate_communication_content(content_type: str, subject: str, details: Optional[str], tone: str, style: str, additional_info: Optional[str] = None) -> str:
-    """Generate communication content using OpenAI API."""
-    
-    # Create content type specific prompts
-    content_prompts = {
-        "meeting-agenda": "Create a professional meeting agenda",
-        "meeting-description": "Create a comprehensive meeting description",
-        "slack-message": "Create an engaging Slack message"
-    }
-    
-    # Create tone specific guidelines
-    tone_guidelines = {
-        "professional": "using formal business language and structure",
-        "casual": "using friendly, relaxed language",
-        "friendly": "using warm, approachable language",
-        "urgent": "using direct, action-oriented language that conveys importance",
-        "informative": "using clear, educational language that explains well",
-        "collaborative": "using inclusive language that encourages participation"
-    }
-    
-    # Create style specific formatting
-    style_guidelines = {
-        "concise": "Keep it brief and to the point",
-        "detailed": "Provide comprehensive information with thorough explanations",
-        "bullet-points": "Use bullet points and structured formatting",
-        "structured": "Use clear sections and organized formatting",
-        "action-oriented": "Focus on actionable items and next steps"
-    }
-    
-    base_prompt = content_prompts.get(content_type, "Create professional communication content")
-    tone_guide = tone_guidelines.get(tone, "using appropriate professional language")
-    style_guide = style_guidelines.get(style, "with clear formatting")
-    
-    # Build the main prompt
-    prompt = f"{base_prompt} {tone_guide} and {style_guide}.\n\n"
-    prompt += f"Subject/Title: {subject}\n"
-    
-    if details:
-        prompt += f"Context/Details: {details}\n"
-    
-    # Add specific instructions based on content type
-    if content_type == "meeting-agenda":
-        prompt += "\nInclude: Meeting objectives, agenda items with time allocations, attendees/roles, and action items. Format it professionally."
-    elif content_type == "meeting-description":
-        prompt += "\nInclude: Meeting purpose, expected outcomes, key discussion points, and participant expectations."
-    elif content_type == "slack-message":
-        prompt += "\nMake it appropriate for team communication, engaging, and clear. Include relevant emojis if the tone allows."
-    
-    if additional_info:
-        prompt += f"\nAdditional Requirements: {additional_info}"
-    
-    # Call OpenAI API
-    response = openai.chat.completions.create(
-        model="gpt-3.5-turbo",
-        messages=[
-            {"role": "system", "content": "You are an expert at creating professional business communication content."},
-            {"role": "user", "content": prompt}
-        ],
-        max_tokens=1000,
-        temperature=0.7
-    )
-    
-    return response.choices[0].message.content
+@functools.lru_cache(maxsize=64)
+def get_jira_auth(username: str, api_token: str) -> httpx.BasicAuth:
+    """Get Basic auth for a Jira user (the header is encoded once per credential pair)."""
+    return httpx.BasicAuth(username, api_token)
 
-def create_jira_ticket_in_instance(subject: str, content: str, ticket_type: str, priority: str, jira_settings: JiraSettings) -> str:
+async def create_jira_ticket_in_instance(jira_client: httpx.AsyncClient, subject: str, content: str, ticket_type: str, priority: str, jira_settings: JiraSettings) -> str:
     """Create a Jira ticket in the specified Jira instance."""
     
-    # Map ticket types to Jira issue types
-    jira_issue_types = {
-        "epic": "Epic",
-        "story": "Story",
-        "task": "Task",
-        "bug": "Bug",
-        "improvement": "Improvement",
-        "feature": "New Feature"
-    }
-    
-    issue_type = jira_issue_types.get(ticket_type, "Task")
+    issue_type = JIRA_ISSUE_TYPES.get(ticket_type, "Task")
     
     # Prepare authentication
-    auth_string = f"{jira_settings.username}:{jira_settings.api_token}"
-    auth_bytes = auth_string.encode('ascii')
-    auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
-    
-    # Prepare headers
-    headers = {
-        'Authorization': f'Basic {auth_b64}',
-        'Content-Type': 'application/json',
-        'Accept': 'application/json'
-    }
+    auth = get_jira_auth(jira_settings.username, jira_settings.api_token)
     
     # Prepare the issue data
     issue_data = {
@@ -526,7 +493,7 @@ def create_jira_ticket_in_instance(subject: str, content: str, ticket_type: str,
     
     try:
         # Make the API call
-        response = requests.post(url, headers=headers, data=json.dumps(issue_data))
+        response = await jira_client.post(url, auth=auth, headers=JIRA_HEADERS, json=issue_data)
         
         if response.status_code == 201:
             # Success - return the ticket URL
@@ -539,9 +506,22 @@ def create_jira_ticket_in_instance(subject: str, content: str, ticket_type: str,
             error_detail = response.json() if response.content else {"error": "Unknown error"}
             raise Exception(f"Failed to create Jira ticket: {response.status_code} - {error_detail}")
     
-    except requests.exceptions.RequestException as e:
+    except httpx.RequestError as e:
         raise Exception(f"Failed to connect to Jira: {str(e)}")
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    # Production defaults: one worker per core, uvloop event loop and httptools
+    # HTTP parser. Use `uvicorn main:app --reload` for development.
+    workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+    # Workers inherit this, so each takes its share of the OpenAI limits
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        reload=False
+    )